@@ -23,6 +23,8 @@ CREATE TABLE movies (
     imdb_id VARCHAR(20),
     tmdb_id INTEGER,
     content_embedding vector(384),    -- Movie content vector (384-dim from all-MiniLM-L12-v2)
+    content_embedding_hv halfvec(384) -- Half-precision copy used by search (pgvector 0.7+)
+        GENERATED ALWAYS AS (content_embedding::halfvec(384)) STORED,
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -78,6 +80,21 @@ CREATE INDEX movies_search_idx ON movies
   USING bm25 (movie_id, title, year, imdb_id, tmdb_id, genres)
   WITH (key_field='movie_id');
 
+-- HNSW vector index (pgvector) for nearest-neighbour lookups on user embeddings
+CREATE INDEX idx_movies_content_embedding_hv ON movies
+  USING hnsw (content_embedding_hv halfvec_cosine_ops)
+  WITH (m = 16, ef_construction = 200);
+
+/*
+-- Upgrading an existing database without reloading:
+ALTER TABLE movies ADD COLUMN content_embedding_hv halfvec(384)
+    GENERATED ALWAYS AS (content_embedding::halfvec(384)) STORED;
+DROP INDEX IF EXISTS idx_movies_content_embedding;
+CREATE INDEX idx_movies_content_embedding_hv ON movies
+  USING hnsw (content_embedding_hv halfvec_cosine_ops)
+  WITH (m = 16, ef_construction = 200);
+*/
+
 -- ========================================
 -- Sample Queries for Array Operations
 -- ========================================
@@ -128,6 +145,8 @@ Index overhead: ~20-30MB
 
 Performance characteristics:
 - GIN index on genres: O(log n) for array searches
+- HNSW index on content_embedding_hv: approximate top-k by cosine distance
+- halfvec (FP16) search copy: half the bytes read per distance computation
 - Composite primary keys: Prevent duplicates, fast lookups
 - No surrogate keys: Better storage efficiency
 */
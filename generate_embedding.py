@@ -50,12 +50,11 @@ class MovieEmbeddingGenerator:
         FileUtils.validate_file_exists(movies_csv, "Movies CSV file")
 
         movies = []
-        with open(movies_csv, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                movie_id = int(row['movieId'])
-                title, year = MovieDataUtils.extract_year_from_title(row['title'])
-                genres = MovieDataUtils.parse_genres(row['genres'])
+        for batch in FileUtils.batch_csv_reader(movies_csv, 10000, named_rows=True):
+            for row in batch:
+                movie_id = int(row.movieId)
+                title, year = MovieDataUtils.extract_year_from_title(row.title)
+                genres = MovieDataUtils.parse_genres(row.genres)
 
                 movies.append({
                     'movie_id': movie_id,
@@ -28,6 +28,54 @@ from utils import (
 )
 
 
+# Users updated per transaction
+COMMIT_EVERY = 100
+
+# Per-user embedding update, run as a prepared statement; the three
+# placeholders all take the user_id
+USER_EMBEDDING_SQL = """
+    UPDATE users u
+    SET embedding = (
+        WITH preference_vectors AS (
+            SELECT
+                CASE
+                    WHEN r.rating >= 4.0 THEN
+                        -- Positive: Add weighted movie embedding
+                        ARRAY(
+                            SELECT elem * (r.rating - 3.0)
+                            FROM unnest(m.content_embedding::float4[]) AS elem
+                        )::vector(384)
+                    ELSE
+                        -- Negative: Subtract weighted movie embedding
+                        ARRAY(
+                            SELECT elem * -(3.0 - r.rating)
+                            FROM unnest(m.content_embedding::float4[]) AS elem
+                        )::vector(384)
+                END as weighted_vector
+            FROM ratings r
+            JOIN movies m ON r.movie_id = m.movie_id
+            WHERE r.user_id = %s
+              AND m.content_embedding IS NOT NULL
+              AND (r.rating >= 4.0 OR r.rating < 3.0)
+        ),
+        combined_vector AS (
+            SELECT SUM(weighted_vector) as user_vector
+            FROM preference_vectors
+        )
+        SELECT user_vector FROM combined_vector
+    ),
+    updated_at = NOW()
+    WHERE u.user_id = %s
+      AND EXISTS (
+        SELECT 1 FROM ratings r
+        JOIN movies m ON r.movie_id = m.movie_id
+        WHERE r.user_id = %s
+          AND m.content_embedding IS NOT NULL
+          AND (r.rating >= 4.0 OR r.rating < 3.0)
+    )
+"""
+
+
 class PureSQLEmbeddingGenerator:
     """Generate user embeddings using pure SQL operations"""
 
@@ -44,50 +92,6 @@ class PureSQLEmbeddingGenerator:
             print_error(f"Database setup failed: {e}")
             raise
 
-    def generate_user_embedding_sql(self, user_id: int) -> str:
-        """Generate SQL for a single user embedding update"""
-        return f"""
-            UPDATE users u
-            SET embedding = (
-                WITH preference_vectors AS (
-                    SELECT
-                        CASE
-                            WHEN r.rating >= 4.0 THEN
-                                -- Positive: Add weighted movie embedding
-                                ARRAY(
-                                    SELECT elem * (r.rating - 3.0)
-                                    FROM unnest(m.content_embedding::float4[]) AS elem
-                                )::vector(384)
-                            ELSE
-                                -- Negative: Subtract weighted movie embedding
-                                ARRAY(
-                                    SELECT elem * -(3.0 - r.rating)
-                                    FROM unnest(m.content_embedding::float4[]) AS elem
-                                )::vector(384)
-                        END as weighted_vector
-                    FROM ratings r
-                    JOIN movies m ON r.movie_id = m.movie_id
-                    WHERE r.user_id = {user_id}
-                      AND m.content_embedding IS NOT NULL
-                      AND (r.rating >= 4.0 OR r.rating < 3.0)
-                ),
-                combined_vector AS (
-                    SELECT SUM(weighted_vector) as user_vector
-                    FROM preference_vectors
-                )
-                SELECT user_vector FROM combined_vector
-            ),
-            updated_at = NOW()
-            WHERE u.user_id = {user_id}
-              AND EXISTS (
-                SELECT 1 FROM ratings r
-                JOIN movies m ON r.movie_id = m.movie_id
-                WHERE r.user_id = {user_id}
-                  AND m.content_embedding IS NOT NULL
-                  AND (r.rating >= 4.0 OR r.rating < 3.0)
-            )
-        """
-
     def generate_embeddings_pure_sql(self, user_ids: Optional[List[int]] = None) -> None:
         """Generate user embeddings using directional vectors"""
         try:
@@ -111,14 +115,16 @@ class PureSQLEmbeddingGenerator:
                 print_info(f"🚀 Generating FIXED embeddings for ALL {len(user_ids)} users...")
                 print_data("✨ Using vector addition/subtraction")
 
-            # Process each user with the same SQL
-            total_affected = 0
-            for user_id in user_ids:
-                user_sql = self.generate_user_embedding_sql(user_id)
-                affected_rows = self.db.execute_update(user_sql)
-                total_affected += affected_rows
-  
-            print_success(f"✅ Updated embeddings for {affected_rows} users")
+            # Process each user with the same prepared statement, committing
+            # every COMMIT_EVERY users so a failure keeps earlier updates
+            total_affected = self.db.execute_prepared(
+                "user_embedding", USER_EMBEDDING_SQL,
+                ((user_id, user_id, user_id) for user_id in user_ids),
+                param_types=("integer", "integer", "integer"),
+                commit_every=COMMIT_EVERY
+            )
+
+            print_success(f"✅ Updated embeddings for {total_affected} users")
 
         except Exception as e:
             print_error(f"Pure SQL embedding generation failed: {e}")
@@ -14,10 +14,9 @@ Compatible with Python 3.8+
 
 import os
 import sys
-import csv
 import argparse
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Tuple
 from datetime import datetime
 from tqdm import tqdm
 
@@ -43,7 +42,7 @@ class MovieLensIngester:
         self.db_config = db_config or ConfigManager.get_db_config()
         self.batch_size = batch_size
         self.logger = LoggingUtils.setup_logging()
-        self.db = DatabaseConnection(self.db_config)
+        self.db = DatabaseConnection(self.db_config, bulk_mode=True)
 
     def connect(self) -> None:
         """Establish database connection"""
@@ -64,32 +63,32 @@ class MovieLensIngester:
         links_data = {}
         if links_csv and links_csv.exists():
             self.logger.info(f"🔗 Loading external IDs from {links_csv}")
-            with open(links_csv, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    movie_id = int(row['movieId'])
-                    links_data[movie_id] = {
-                        'imdb_id': f"tt{row['imdbId']}" if row.get('imdbId') else None,
-                        'tmdb_id': int(row['tmdbId']) if row.get('tmdbId') else None
+            for batch in FileUtils.batch_csv_rows(links_csv, self.batch_size,
+                                                  ['movieId', 'imdbId', 'tmdbId']):
+                for movie_id, imdb_id, tmdb_id in batch:
+                    links_data[int(movie_id)] = {
+                        'imdb_id': f"tt{imdb_id}" if imdb_id else None,
+                        'tmdb_id': int(tmdb_id) if tmdb_id else None
                     }
 
         # Count total rows for progress bar
         total_rows = FileUtils.count_csv_rows(movies_csv)
 
         with tqdm(total=total_rows, desc="🎬 Ingesting movies", unit="movies") as pbar:
-            for batch in FileUtils.batch_csv_reader(movies_csv, self.batch_size):
+            for batch in FileUtils.batch_csv_rows(movies_csv, self.batch_size,
+                                                  ['movieId', 'title', 'genres']):
                 self._ingest_movies_batch(batch, links_data)
                 pbar.update(len(batch))
 
-    def _ingest_movies_batch(self, batch: List[Dict[str, Any]], links_data: Dict[int, Dict]) -> None:
-        """Ingest a batch of movies using COPY + ON CONFLICT for upserts"""
+    def _ingest_movies_batch(self, batch: List[Tuple[str, ...]], links_data: Dict[int, Dict]) -> None:
+        """Ingest a batch of (movieId, title, genres) rows using COPY + ON CONFLICT for upserts"""
         try:
             # Prepare batch data
             movie_data = []
-            for row in batch:
-                movie_id = int(row['movieId'])
-                title, year = MovieDataUtils.extract_year_from_title(row['title'])
-                genres = MovieDataUtils.parse_genres(row['genres'])
+            for movie_id, raw_title, raw_genres in batch:
+                movie_id = int(movie_id)
+                title, year = MovieDataUtils.extract_year_from_title(raw_title)
+                genres = MovieDataUtils.parse_genres(raw_genres)
 
                 # Add external IDs if available
                 link_info = links_data.get(movie_id, {})
@@ -117,15 +116,12 @@ class MovieLensIngester:
 
             self.db.execute_no_response(create_temp_table)
 
-            # Copy batch to temp table
-            self.db.execute_batch(
-                """
-                INSERT INTO temp_movies (movie_id, title, year, genres, imdb_id, tmdb_id)
-                VALUES %s
-                """,
+            # Copy batch to temp table (binary COPY)
+            self.db.copy_binary(
+                "temp_movies",
+                ["movie_id", "title", "year", "genres", "imdb_id", "tmdb_id"],
                 movie_data,
-                template=None,
-                page_size=len(movie_data)
+                ["int4", "text", "int2", "text[]", "text", "int4"]
             )
 
             # Merge using modern PostgreSQL ON CONFLICT syntax
@@ -158,10 +154,8 @@ class MovieLensIngester:
 
         # First pass: collect unique user IDs
         unique_users = set()
-        with open(ratings_csv, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                unique_users.add(int(row['userId']))
+        for batch in FileUtils.batch_csv_rows(ratings_csv, self.batch_size, ['userId']):
+            unique_users.update(int(user_id) for user_id, in batch)
 
         self.logger.info(f"📊 Found {len(unique_users)} unique users")
 
@@ -187,8 +181,7 @@ class MovieLensIngester:
                 ON CONFLICT (user_id) DO NOTHING
                 """,
                 user_data,
-                template=None,
-                page_size=len(user_data)
+                template=None
             )
 
             self.db.commit()
@@ -206,21 +199,22 @@ class MovieLensIngester:
         total_rows = FileUtils.count_csv_rows(ratings_csv)
 
         with tqdm(total=total_rows, desc="⭐ Ingesting ratings", unit="ratings") as pbar:
-            for batch in FileUtils.batch_csv_reader(ratings_csv, self.batch_size):
+            for batch in FileUtils.batch_csv_rows(ratings_csv, self.batch_size,
+                                                  ['userId', 'movieId', 'rating', 'timestamp']):
                 self._ingest_ratings_batch(batch)
                 pbar.update(len(batch))
 
-    def _ingest_ratings_batch(self, batch: List[Dict[str, Any]]) -> None:
-        """Ingest a batch of ratings with timestamp conversion"""
+    def _ingest_ratings_batch(self, batch: List[Tuple[str, ...]]) -> None:
+        """Ingest a batch of (userId, movieId, rating, timestamp) rows with timestamp conversion"""
         try:
             rating_data = []
-            for row in batch:
-                rating_timestamp = datetime.fromtimestamp(int(row['timestamp']))
+            for user_id, movie_id, rating, timestamp in batch:
+                rating_timestamp = datetime.fromtimestamp(int(timestamp))
 
                 rating_data.append((
-                    int(row['userId']),
-                    int(row['movieId']),
-                    float(row['rating']),
+                    int(user_id),
+                    int(movie_id),
+                    float(rating),
                     rating_timestamp
                 ))
 
@@ -234,8 +228,7 @@ class MovieLensIngester:
                     created_at = ratings.created_at  -- Preserve original created_at
                 """,
                 rating_data,
-                template=None,
-                page_size=len(rating_data)
+                template=None
             )
 
             self.db.commit()
@@ -253,21 +246,22 @@ class MovieLensIngester:
         total_rows = FileUtils.count_csv_rows(tags_csv)
 
         with tqdm(total=total_rows, desc="🏷️  Ingesting tags", unit="tags") as pbar:
-            for batch in FileUtils.batch_csv_reader(tags_csv, self.batch_size):
+            for batch in FileUtils.batch_csv_rows(tags_csv, self.batch_size,
+                                                  ['userId', 'movieId', 'tag', 'timestamp']):
                 self._ingest_tags_batch(batch)
                 pbar.update(len(batch))
 
-    def _ingest_tags_batch(self, batch: List[Dict[str, Any]]) -> None:
-        """Ingest a batch of tags with timestamp conversion"""
+    def _ingest_tags_batch(self, batch: List[Tuple[str, ...]]) -> None:
+        """Ingest a batch of (userId, movieId, tag, timestamp) rows with timestamp conversion"""
         try:
             tag_data = []
-            for row in batch:
-                tag_timestamp = datetime.fromtimestamp(int(row['timestamp']))
+            for user_id, movie_id, tag, timestamp in batch:
+                tag_timestamp = datetime.fromtimestamp(int(timestamp))
 
                 tag_data.append((
-                    int(row['userId']),
-                    int(row['movieId']),
-                    row['tag'].strip(),
+                    int(user_id),
+                    int(movie_id),
+                    tag.strip(),
                     tag_timestamp
                 ))
 
@@ -280,8 +274,7 @@ class MovieLensIngester:
                     created_at = tags.created_at  -- Preserve original created_at
                 """,
                 tag_data,
-                template=None,
-                page_size=len(tag_data)
+                template=None
             )
 
             self.db.commit()
@@ -15,9 +15,10 @@ Requirements:
 import os
 import sys
 import argparse
+from itertools import chain, count, islice
 from pathlib import Path
 from tqdm import tqdm
-from typing import List, Dict, Any
+from typing import Dict, Iterable, Iterator, Tuple
 
 from utils import (
     DatabaseConnection,
@@ -38,7 +39,7 @@ class EmbeddingIngester:
     def __init__(self, db_config: Dict[str, str] = None, batch_size: int = 1000):
         self.db_config = db_config or ConfigManager.get_db_config()
         self.batch_size = batch_size
-        self.db = DatabaseConnection(self.db_config)
+        self.db = DatabaseConnection(self.db_config, bulk_mode=True)
 
     def connect(self) -> None:
         """Establish database connection"""
@@ -48,57 +49,61 @@ class EmbeddingIngester:
         """Close database connection"""
         self.db.close()
 
-    def load_embeddings_csv(self, csv_path: Path) -> List[Dict[str, Any]]:
-        """Load embeddings from CSV file"""
-        return FileUtils.load_json_embeddings(csv_path, 'movie_id', 'movie_embedding')
+    def iter_embeddings_csv(self, csv_path: Path) -> Iterator[Tuple[int, str]]:
+        """Stream (movie_id, embedding literal) rows from CSV file
 
-    def ingest_embeddings(self, embeddings: List[Dict[str, Any]]) -> None:
-        """Ingest embeddings into movies table using batch processing"""
+        The JSON array text is passed through unparsed and cast to vector
+        by PostgreSQL.
+        """
+        return FileUtils.iter_json_embeddings(csv_path, 'movie_id', 'movie_embedding',
+                                              raw_text=True)
 
-        print_data(f"📦 Ingesting {len(embeddings)} embeddings...")
+    def ingest_embeddings(self, embeddings: Iterable[Tuple[int, str]], total: int) -> None:
+        """Ingest embeddings into movies table using batch processing
+
+        Rows are pulled from the iterable one batch at a time, so only a
+        single batch is held in memory.
+
+        Args:
+            embeddings: Iterable of (movie_id, vector literal) tuples
+            total: Expected number of rows (for progress and summary)
+        """
+
+        print_data(f"📦 Ingesting {total} embeddings...")
         print_data(f"🎯 Batch size: {self.batch_size}")
         print()
 
         total_processed = 0
         total_failed = 0
+        rows = iter(embeddings)
 
-        with tqdm(total=len(embeddings), desc="🚀 Uploading embeddings", unit="embeddings") as pbar:
-            for i in range(0, len(embeddings), self.batch_size):
-                batch = embeddings[i:i + self.batch_size]
+        with tqdm(total=total, desc="🚀 Uploading embeddings", unit="embeddings") as pbar:
+            for batch_number in count(1):
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
 
                 try:
-                    # Prepare batch data
-                    update_data = [
-                        (
-                            item['movie_id'],
-                            item['content_embedding']
-                        )
-                        for item in batch
-                    ]
-
                     # Create temporary table for batch updates
                     self.db.execute_no_response("""
                         CREATE TEMP TABLE temp_embeddings (
                             movie_id INTEGER,
-                            content_embedding vector(384)
+                            content_embedding TEXT
                         ) ON COMMIT DROP;
                     """)
 
-                    # Insert batch data into temp table
-                    self.db.execute_batch(
-                        """
-                        INSERT INTO temp_embeddings (movie_id, content_embedding)
-                        VALUES %s
-                        """,
-                        update_data,
-                        template=None,
-                        page_size=len(update_data)
+                    # Binary COPY batch data into temp table
+                    self.db.copy_binary(
+                        "temp_embeddings",
+                        ["movie_id", "content_embedding"],
+                        batch,
+                        ["int4", "text"]
                     )
 
                     # Update movies table from temp table
                     self.db.execute_update("""
                         UPDATE movies m
-                        SET content_embedding = t.content_embedding
+                        SET content_embedding = t.content_embedding::vector
                         FROM temp_embeddings t
                         WHERE m.movie_id = t.movie_id
                     """, commit=False)
@@ -111,7 +116,7 @@ class EmbeddingIngester:
 
                 except Exception as e:
                     self.db.rollback()
-                    print_error(f"❌ Batch {i//self.batch_size + 1} failed: {e}")
+                    print_error(f"❌ Batch {batch_number} failed: {e}")
                     total_failed += len(batch)
                     pbar.update(len(batch))
 
@@ -120,7 +125,7 @@ class EmbeddingIngester:
         print_success(f"✅ Successfully processed: {total_processed}")
         if total_failed > 0:
             print_error(f"❌ Failed: {total_failed}")
-        success_rate = (total_processed / len(embeddings)) * 100
+        success_rate = (total_processed / max(total_processed + total_failed, 1)) * 100
         print_success(f"📈 Success rate: {success_rate:.1f}%")
 
     def verify_ingestion(self, expected_count: int) -> None:
@@ -215,23 +220,25 @@ def main():
         # Connect to database
         ingester.connect()
 
-        # Load embeddings from CSV
-        print_progress("📖 Loading embeddings from CSV...")
-        embeddings = ingester.load_embeddings_csv(embeddings_csv)
-        print_success(f"✅ Loaded {len(embeddings)} embeddings")
+        # Stream embeddings from CSV (rows are parsed batch by batch)
+        print_progress("📖 Reading embeddings from CSV...")
+        total = FileUtils.count_csv_rows(embeddings_csv)
+        embeddings = ingester.iter_embeddings_csv(embeddings_csv)
+        print_success(f"✅ Found {total} embeddings")
         print()
 
-        # Show sample
+        # Show sample (the peeked rows are put back in front of the stream)
+        sample = list(islice(embeddings, 3))
         print_data("🔍 Sample data:")
-        for i, item in enumerate(embeddings[:3]):
-            print_data(f"  🎬 Movie {item['movie_id']}: {len(item['content_embedding'])} dimensions")
+        for movie_id, embedding_literal in sample:
+            print_data(f"  🎬 Movie {movie_id}: {embedding_literal.count(',') + 1} dimensions")
         print()
 
         # Ingest embeddings
-        ingester.ingest_embeddings(embeddings)
+        ingester.ingest_embeddings(chain(sample, embeddings), total)
 
         # Verify ingestion
-        ingester.verify_ingestion(len(embeddings))
+        ingester.verify_ingestion(total)
 
         # Show sample results
         ingester.get_sample_embeddings()
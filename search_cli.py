@@ -13,13 +13,18 @@ Usage:
     python search_cli.py --query "lord" --user-id 10001 [--show-scores]
 """
 
-import argparse
 import sys
 import os
-from typing import List, Dict, Any, Optional
+import json
+import re
+import signal
+import weakref
+from types import SimpleNamespace
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from utils import (
     DatabaseConnection,
     ConfigManager,
+    execute_statement,
     print_success,
     print_error,
     print_info,
@@ -27,12 +32,238 @@ from utils import (
 )
 
 
+# Candidate pool shared by the retrieval queries: the top BM25 hits plus the
+# query matches among the user's nearest movies (served by the HNSW index).
+# Candidates are kept narrow (movie_id, embedding, BM25 score): the ranking
+# steps never re-read movies, and title/year/genres are joined back only for
+# the rows that survive the final cut.
+# Distances use the half-precision content_embedding_hv column, with the user
+# embedding cast to halfvec once in user_check.
+# user_check is the only read of the users table: it is materialized once
+# per query and feeds both the ANN probe and the similarity step. It is
+# empty when the user is unknown or has no embedding, which makes any query
+# joining it return no rows.
+# Parameters: user_id, ann_limit, bm25 query, recall_limit, bm25 query
+CANDIDATE_POOL_CTES = """
+            user_check AS MATERIALIZED (
+                SELECT embedding::halfvec(384) as embedding
+                FROM users
+                WHERE user_id = %s AND embedding IS NOT NULL
+            ),
+            ann_candidates AS (
+                SELECT movie_id
+                FROM movies
+                ORDER BY content_embedding_hv <=> (SELECT embedding FROM user_check)
+                LIMIT %s
+            ),
+            bm25_candidates AS (
+                SELECT
+                    movie_id, content_embedding_hv,
+                    paradedb.score(movie_id) as bm25_score
+                FROM movies
+                WHERE movies @@@ %s
+                ORDER BY paradedb.score(movie_id) DESC, movie_id ASC
+                LIMIT %s
+            ),
+            first_pass_retrieval AS (
+                SELECT * FROM bm25_candidates
+                UNION ALL
+                SELECT
+                    movie_id, content_embedding_hv,
+                    paradedb.score(movie_id) as bm25_score
+                FROM movies
+                WHERE movies @@@ %s
+                  AND movie_id IN (SELECT movie_id FROM ann_candidates)
+                  AND movie_id NOT IN (SELECT movie_id FROM bm25_candidates)
+            )"""
+
+# pgvector's HNSW scan returns at most hnsw.ef_search rows (default 40), so
+# the ANN probe raises it to ann_limit, within pgvector's allowed maximum.
+HNSW_EF_SEARCH_DEFAULT = 40
+HNSW_EF_SEARCH_MAX = 1000
+
+
+def ann_setup_sql(ann_limit: int) -> str:
+    """SQL run ahead of a search so the HNSW probe can return ann_limit rows"""
+    ef_search = min(max(int(ann_limit), HNSW_EF_SEARCH_DEFAULT), HNSW_EF_SEARCH_MAX)
+    return f"SET LOCAL hnsw.ef_search = {ef_search}; "
+
+
+# Search statements, built once at import. Parameters follow
+# CANDIDATE_POOL_CTES where the pool is used.
+
+# Hybrid ranking under several weight pairs (unified_search_multi).
+# The ranked rows hang off a one-row user status, so the result is never
+# empty: a single row with NULL weight_id means no matches, and user_ok
+# tells an unknown user (or one without embedding) from a query that
+# matched nothing.
+# Parameters: pool parameters, bm25 weights, similarity weights,
+# title length (twice), per-weight limit
+HYBRID_SEARCH_SQL = f"""
+            WITH {CANDIDATE_POOL_CTES},
+            bounds AS (
+                SELECT MIN(bm25_score) as mn, MAX(bm25_score) as mx
+                FROM first_pass_retrieval
+            ),
+            normalization AS (
+                SELECT
+                    f.*,
+                    CASE
+                        WHEN b.mx = b.mn THEN 0.5
+                        ELSE (f.bm25_score - b.mn) / (b.mx - b.mn)
+                    END as normalized_bm25
+                FROM first_pass_retrieval f
+                CROSS JOIN bounds b
+            ),
+            personalized_ranker AS (
+                SELECT
+                    n.movie_id, n.bm25_score, n.normalized_bm25,
+                    (1 - (u.embedding <=> n.content_embedding_hv)) as cosine_similarity
+                FROM normalization n
+                CROSS JOIN user_check u
+            ),
+            joint_ranker AS (
+                SELECT
+                    p.*,
+                    w.weight_id,
+                    (w.bm25_weight * p.normalized_bm25 +
+                     w.similarity_weight * p.cosine_similarity) as combined_score
+                FROM personalized_ranker p
+                CROSS JOIN UNNEST(%s::float8[], %s::float8[]) WITH ORDINALITY
+                    AS w(bm25_weight, similarity_weight, weight_id)
+            ),
+            ranked AS (
+                SELECT
+                    *,
+                    row_number() OVER (
+                        PARTITION BY weight_id
+                        ORDER BY combined_score DESC, bm25_score DESC, movie_id ASC
+                    ) as rank
+                FROM joint_ranker
+            )
+            SELECT
+                s.user_ok,
+                r.weight_id,
+                r.movie_id,
+                CASE
+                    WHEN char_length(m.title) > %s THEN LEFT(m.title, %s - 3) || '...'
+                    ELSE m.title
+                END as title,
+                m.year, m.genres,
+                r.normalized_bm25 as normalized_bm25_score,
+                r.cosine_similarity,
+                r.combined_score
+            FROM (SELECT EXISTS (SELECT 1 FROM user_check) as user_ok) s
+            LEFT JOIN (ranked r JOIN movies m ON m.movie_id = r.movie_id)
+                ON r.rank <= %s
+            ORDER BY r.weight_id, r.rank
+        """
+
+# BM25-only ranking (_bm25_only_search).
+# Parameters: bm25 query, recall_limit, limit
+BM25_ONLY_SQL = """
+            WITH first_pass_retrieval AS (
+                SELECT
+                    movie_id,
+                    paradedb.score(movie_id) as bm25_score
+                FROM movies
+                WHERE movies @@@ %s
+                ORDER BY paradedb.score(movie_id) DESC, movie_id ASC
+                LIMIT %s
+            ),
+            bounds AS (
+                SELECT MIN(bm25_score) as mn, MAX(bm25_score) as mx
+                FROM first_pass_retrieval
+            ),
+            ranked AS (
+                SELECT
+                    f.movie_id, f.bm25_score,
+                    CASE
+                        WHEN b.mx = b.mn THEN 0.5
+                        ELSE (f.bm25_score - b.mn) / (b.mx - b.mn)
+                    END as normalized_bm25_score
+                FROM first_pass_retrieval f
+                CROSS JOIN bounds b
+                ORDER BY f.bm25_score DESC, f.movie_id ASC
+                LIMIT %s
+            )
+            SELECT r.movie_id, m.title, m.year, m.genres, r.normalized_bm25_score
+            FROM ranked r
+            JOIN movies m ON m.movie_id = r.movie_id
+            ORDER BY r.bm25_score DESC, r.movie_id ASC
+        """
+
+# Similarity-only ranking (_similarity_only_search).
+# Parameters: pool parameters, limit
+SIMILARITY_ONLY_SQL = f"""
+            WITH {CANDIDATE_POOL_CTES},
+            ranked AS (
+                SELECT
+                    f.movie_id,
+                    (u.embedding <=> f.content_embedding_hv) as distance
+                FROM first_pass_retrieval f
+                CROSS JOIN user_check u
+                ORDER BY distance ASC, f.movie_id ASC
+                LIMIT %s
+            )
+            SELECT
+                r.movie_id, m.title, m.year, m.genres,
+                (1 - r.distance) as cosine_similarity
+            FROM ranked r
+            JOIN movies m ON m.movie_id = r.movie_id
+            ORDER BY r.distance ASC, r.movie_id ASC
+        """
+
+
+class MovieResult(NamedTuple):
+    """One ranked movie, built straight from a result row
+
+    Field order matches the columns the search statements select. A score
+    the ranking did not compute is None.
+    """
+    movie_id: int
+    title: str
+    year: Optional[int]
+    genres: List[str]
+    normalized_bm25_score: Optional[float]
+    cosine_similarity: Optional[float]
+    combined_score: float
+
+
+# Parameter types of the prepared hybrid_search statement (unified_search_multi)
+HYBRID_SEARCH_PARAM_TYPES = ("integer", "integer", "text", "integer", "text",
+                             "float8[]", "float8[]", "integer", "integer", "integer")
+
+
+def write_stdout(text: str) -> None:
+    """Write text to stdout as UTF-8 bytes, bypassing the text-mode encoder
+
+    Falls back to sys.stdout.write when stdout has no binary buffer
+    (e.g. when it has been replaced by a StringIO).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    # Flush pending text first so earlier print() output stays in order
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8"))
+    buffer.flush()
+
+
 class PersonalizedSearchEngine:
     """Engine for personalized movie search with multiple scoring approaches"""
 
-    def __init__(self):
+    def __init__(self, profile: bool = False):
         self.db_config = ConfigManager.get_db_config()
         self.db = None
+        self.profile = profile
+        self._validated_users = set()
+
+        # Terminal layout and table frames are cached across searches and
+        # dropped when the terminal is resized (see watch_terminal_resize)
+        self._layout = None
+        self._frames = {}
 
     def connect(self) -> None:
         """Establish database connection"""
@@ -44,10 +275,17 @@ class PersonalizedSearchEngine:
             raise
 
     def validate_user(self, user_id: int) -> bool:
-        """Check if user exists and has embedding"""
+        """Check if user exists and has embedding
+
+        Successful checks are cached per engine, including users confirmed
+        by a search query, so those skip the round-trip.
+        """
+        if user_id in self._validated_users:
+            return True
+
         try:
             result = self.db.execute_query("""
-                SELECT user_id, embedding IS NOT NULL as has_embedding
+                SELECT embedding IS NOT NULL as has_embedding
                 FROM users
                 WHERE user_id = %s
             """, (user_id,))
@@ -56,12 +294,13 @@ class PersonalizedSearchEngine:
                 print_error(f"User {user_id} not found in database")
                 return False
 
-            user_id_found, has_embedding = result[0]
+            has_embedding, = result[0]
             if not has_embedding:
                 print_error(f"User {user_id} exists but has no embedding")
                 print_info("Run generate_user_embeddings.py first to create user embeddings")
                 return False
 
+            self._validated_users.add(user_id)
             return True
 
         except Exception as e:
@@ -70,16 +309,133 @@ class PersonalizedSearchEngine:
 
   
     
+    def unified_search_multi(self, query: str, user_id: int,
+                             weights: List[Tuple[float, float]], limit: int = 10,
+                             recall_limit: int = 100, ann_limit: int = 100,
+                             title_length: Optional[int] = None) -> List[List[MovieResult]]:
+        """Search under several weight combinations in a single SQL query
+
+        The candidate CTEs run once; every (bm25_weight, similarity_weight)
+        pair is then ranked server-side:
+        1. ann_candidates - Nearest movies to the user embedding (HNSW index)
+        2. first_pass_retrieval - BM25 candidate generation (retrieves recall_limit results),
+           extended with ANN candidates that also match the query
+        3. bounds/normalization - BM25 min/max (one aggregate) and score normalization
+        4. personalized_ranker - Vector similarity calculation
+        5. joint_ranker - Weighted combination for every weight pair
+        6. ranked - Top `limit` rows per weight pair (row_number per weight_id)
+
+        Args:
+            query: Search query string
+            user_id: User ID for personalization
+            weights: List of (bm25_weight, similarity_weight) pairs
+            limit: Number of results to return per weight pair
+            recall_limit: Number of candidates to retrieve for re-ranking
+            ann_limit: Number of nearest-neighbour movies considered as extra candidates
+            title_length: Truncate titles server-side to this many characters
+                (including the "..." suffix). None returns full titles.
+
+        Returns:
+            One ranked list of movies per weight pair, in the order of `weights`.
+            All lists are empty if nothing matches or the user is missing or
+            has no embedding.
+        """
+        # Prefix query with title: for better BM25 search
+        formatted_query = f"title:{query}"
+        params = (user_id, ann_limit, formatted_query, recall_limit, formatted_query,
+                  [w[0] for w in weights], [w[1] for w in weights],
+                  title_length, title_length, limit)
+        try:
+            results = self._execute_prepared("hybrid_search", HYBRID_SEARCH_SQL,
+                                             HYBRID_SEARCH_PARAM_TYPES, params,
+                                             setup_sql=ann_setup_sql(ann_limit))
+
+            # Columns 0 and 1 are user_ok and weight_id. The user check rides
+            # along with the search, so a user it confirms needs no lookup
+            if results[0][0]:
+                self._validated_users.add(user_id)
+            else:
+                self._validated_users.discard(user_id)
+
+            # Split rows into one list per weight pair (weight_id is NULL
+            # on the single status row returned when nothing matched)
+            ranked_lists: List[List[MovieResult]] = [[] for _ in weights]
+            for row in results:
+                if row[1] is not None:
+                    ranked_lists[row[1] - 1].append(MovieResult._make(row[2:]))
+            return ranked_lists
+
+        except Exception as e:
+            print_error(f"Unified search failed: {e}")
+            raise
+
+    def _execute_prepared(self, name: str, sql: str, param_types: Tuple[str, ...],
+                          params: tuple, setup_sql: str = "") -> List[tuple]:
+        """Execute a search query as a server-side prepared statement
+
+        The first call on a connection sends PREPARE, setup_sql and EXECUTE
+        in one round-trip; repeat calls only send EXECUTE with the bind
+        parameters, skipping parse and plan.
+        """
+        if self.profile:
+            # EXPLAIN needs the statement to exist beforehand
+            self.db.prepare(name, sql, param_types)
+            self.profile_query(execute_statement(name, len(params)), params, setup_sql)
+        return self.db.execute_query_prepared(name, sql, params, param_types, setup_sql)
+
+    def _execute_search(self, sql: str, params: tuple,
+                        setup_sql: str = "") -> List[tuple]:
+        """Execute a search query, printing its plan first when profiling is enabled
+
+        setup_sql (e.g. SET LOCAL statements) is sent in the same round-trip,
+        ahead of the query. Rows are plain tuples in SELECT column order.
+        """
+        if self.profile:
+            self.profile_query(sql, params, setup_sql)
+        return self.db.execute_query(setup_sql + sql, params)
+
+    def profile_query(self, sql: str, params: tuple, setup_sql: str = "") -> None:
+        """Run a query under EXPLAIN (ANALYZE, BUFFERS) and print its plan tree"""
+        result = self.db.execute_query(
+            setup_sql + "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params
+        )
+        plan = result[0][0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plan = plan[0]
+
+        print_info("Query plan (EXPLAIN ANALYZE, BUFFERS):")
+        self._print_plan_node(plan['Plan'])
+        print_info(f"Planning time: {plan.get('Planning Time', 0.0):.3f} ms, "
+                   f"execution time: {plan.get('Execution Time', 0.0):.3f} ms")
+        print()
+
+    def _print_plan_node(self, node: Dict[str, Any], depth: int = 0) -> None:
+        """Print one plan node (rows, time, buffers) and recurse into its children"""
+        label = node['Node Type']
+        if node.get('Custom Plan Provider'):
+            label += f" [{node['Custom Plan Provider']}]"
+        if node.get('Index Name'):
+            label += f" using {node['Index Name']}"
+        if node.get('Relation Name'):
+            label += f" on {node['Relation Name']}"
+        if node.get('CTE Name'):
+            label += f" ({node['CTE Name']})"
+
+        loops = node.get('Actual Loops', 1)
+        print(f"{'  ' * depth}-> {label}  "
+              f"rows={node.get('Actual Rows', 0)} loops={loops} "
+              f"time={node.get('Actual Total Time', 0.0):.3f}ms "
+              f"shared hit={node.get('Shared Hit Blocks', 0)} "
+              f"read={node.get('Shared Read Blocks', 0)}")
+
+        for child in node.get('Plans', []):
+            self._print_plan_node(child, depth + 1)
+
     def unified_search(self, query: str, user_id: int, bm25_weight: float,
                      similarity_weight: float, limit: int = 10, 
-                     recall_limit: int = 100) -> List[Dict[str, Any]]:
-        """Unified search using single SQL query with parameterized weights
-
-        Executes complete search pipeline in one query:
-        1. first_pass_retrieval - BM25 candidate generation (retrieves recall_limit results)
-        2. normalization - BM25 score normalization
-        3. personalized_ranker - Vector similarity calculation
-        4. joint_ranker - Final weighted combination
+                     recall_limit: int = 100, ann_limit: int = 100) -> List[MovieResult]:
+        """Search with a single (bm25_weight, similarity_weight) combination
 
         Args:
             query: Search query string
@@ -88,97 +444,105 @@ class PersonalizedSearchEngine:
             similarity_weight: Weight for similarity scores (0.0 to 1.0)
             limit: Number of results to return
             recall_limit: Number of candidates to retrieve for re-ranking
+            ann_limit: Number of nearest-neighbour movies considered as extra candidates
 
         Returns:
-            List of movies with all scores calculated
+            List of movies. A score the weighting does not use is None
+            (with similarity_weight == 0 the user is not looked up at all).
+        """
+        # Single-signal weightings are answered directly in SQL: a zero
+        # similarity weight never reads the user embedding, and a zero BM25
+        # weight skips score normalization
+        if similarity_weight == 0:
+            return self._bm25_only_search(query, bm25_weight, limit, recall_limit)
+        if bm25_weight == 0:
+            return self._similarity_only_search(query, user_id, similarity_weight, limit,
+                                                recall_limit, ann_limit)
+
+        return self.unified_search_multi(query, user_id, [(bm25_weight, similarity_weight)],
+                                         limit, recall_limit, ann_limit)[0]
+
+    def _bm25_only_search(self, query: str, bm25_weight: float, limit: int,
+                          recall_limit: int) -> List[MovieResult]:
+        """BM25-only ranking: top BM25 hits without touching embeddings
+
+        Scores are normalized over the top recall_limit BM25 hits. No cosine
+        similarity is computed, so cosine_similarity is None.
         """
-        # Prefix query with title: for better BM25 search
         formatted_query = f"title:{query}"
         try:
-            results = self.db.execute_query("""
-                WITH first_pass_retrieval AS (
-                    SELECT
-                        movie_id, title, year, genres,
-                        paradedb.score(movie_id) as bm25_score
-                    FROM movies
-                    WHERE movies @@@ %s
-                    ORDER BY paradedb.score(movie_id) DESC, movie_id ASC
-                    LIMIT %s
-                ),
-                normalization AS (
-                    SELECT
-                        *,
-                        CASE
-                            WHEN MAX(bm25_score) OVER() = MIN(bm25_score) OVER() THEN 0.5
-                            ELSE (bm25_score - MIN(bm25_score) OVER()) /
-                                 (MAX(bm25_score) OVER() - MIN(bm25_score) OVER())
-                        END as normalized_bm25
-                    FROM first_pass_retrieval
-                ),
-                personalized_ranker AS (
-                    SELECT
-                        n.*,
-                        (1 - (u.embedding <=> m.content_embedding)) as cosine_similarity
-                    FROM normalization n
-                    JOIN movies m ON n.movie_id = m.movie_id
-                    CROSS JOIN users u WHERE u.user_id = %s
-                ),
-                joint_ranker AS (
-                    SELECT
-                        movie_id, title, year, genres,
-                        normalized_bm25,
-                        cosine_similarity,
-                        (%s * normalized_bm25 + %s * cosine_similarity) as combined_score
-                    FROM personalized_ranker
-                )
-                SELECT * FROM joint_ranker
-                ORDER BY combined_score DESC
-                LIMIT %s
-            """, (formatted_query, recall_limit, user_id, bm25_weight, similarity_weight, limit))
-
-            # Convert to list of dictionaries
-            return [
-                {
-                    'movie_id': row[0],
-                    'title': row[1],
-                    'year': row[2],
-                    'genres': row[3],
-                    'normalized_bm25_score': float(row[4]),
-                    'cosine_similarity': float(row[5]),
-                    'combined_score': float(row[6])
-                }
-                for row in results
-            ]
+            results = self._execute_search(BM25_ONLY_SQL,
+                                          (formatted_query, recall_limit, limit))
+
+            # Columns: movie_id, title, year, genres, normalized_bm25_score
+            return [MovieResult(*row, None, bm25_weight * row[4]) for row in results]
 
         except Exception as e:
-            print_error(f"Unified search failed: {e}")
+            print_error(f"BM25 search failed: {e}")
             raise
 
-    def search(self, query: str, user_id: int, show_scores: bool = False, 
-               partial_weight: float = 50.0, recall_limit: int = 100) -> None:
-        """Main search method using unified SQL approach with three weight combinations"""
+    def _similarity_only_search(self, query: str, user_id: int, similarity_weight: float,
+                                limit: int, recall_limit: int,
+                                ann_limit: int) -> List[MovieResult]:
+        """Similarity-only ranking: candidate pool ordered by cosine distance
 
-        # Validate user exists and has embedding
-        if not self.validate_user(user_id):
-            return
+        The BM25 normalization step is skipped entirely, so
+        normalized_bm25_score is None.
+        """
+        formatted_query = f"title:{query}"
+        try:
+            results = self._execute_search(
+                SIMILARITY_ONLY_SQL,
+                (user_id, ann_limit, formatted_query, recall_limit, formatted_query, limit),
+                setup_sql=ann_setup_sql(ann_limit))
+
+            # Columns: movie_id, title, year, genres, cosine_similarity
+            return [MovieResult(*row[:4], None, row[4], similarity_weight * row[4])
+                    for row in results]
+
+        except Exception as e:
+            print_error(f"Similarity search failed: {e}")
+            raise
+
+    def search(self, query: str, user_id: int, show_scores: bool = False, 
+               partial_weight: float = 50.0, recall_limit: int = 100,
+               ann_limit: int = 100, display_limit: int = 10) -> None:
+        """Main search method: one SQL query ranked under three weight combinations"""
 
         # Convert percentage to decimal
         partial_decimal = partial_weight / 100.0
 
-        # Generate results for all three approaches using the unified query
-        bm25_only = self.unified_search(query, user_id, bm25_weight=1.0, similarity_weight=0.0, 
-                                         recall_limit=recall_limit)
-        partial = self.unified_search(query, user_id, bm25_weight=1.0-partial_decimal, 
-                                      similarity_weight=partial_decimal, recall_limit=recall_limit)
-        rerank_only = self.unified_search(query, user_id, bm25_weight=0.0, similarity_weight=1.0, 
-                                          recall_limit=recall_limit)
+        # Rank all three approaches in a single query (titles pre-truncated
+        # to the column width)
+        _, _, max_title_length = self._column_layout()
+        bm25_only, partial, rerank_only = self.unified_search_multi(query, user_id, [
+            (1.0, 0.0),
+            (1.0 - partial_decimal, partial_decimal),
+            (0.0, 1.0)
+        ], limit=display_limit, recall_limit=recall_limit, ann_limit=ann_limit,
+           title_length=max_title_length)
+
+        # The search query doubles as the user check. Only a user it could
+        # not confirm needs the lookup, which reports what is wrong.
+        if not self.validate_user(user_id):
+            return
 
         # Display results in three columns
-        self.display_results(bm25_only, partial, rerank_only, show_scores, partial_weight)
+        self.display_results(bm25_only, partial, rerank_only, show_scores, partial_weight,
+                             display_limit)
 
-    def display_results(self, bm25_results: List[Dict], hybrid_results: List[Dict],
-                       rerank_results: List[Dict], show_scores: bool = False, partial_weight: float = 50.0) -> None:
-        """Display results using full terminal width"""
+    def _invalidate_layout(self) -> None:
+        """Forget the cached terminal layout (called on terminal resize)"""
+        self._layout = None
+        self._frames.clear()
+
+    def _column_layout(self) -> Tuple[int, int, int]:
+        """Compute (terminal_width, col_width, max_title_length) for the three-column display
+
+        The result is cached until the terminal is resized.
+        """
+        if self._layout is not None:
+            return self._layout
 
         # Get terminal width
         try:
@@ -191,68 +555,58 @@ class PersonalizedSearchEngine:
         total_content_width = terminal_width - (separator_width * 2)
         col_width = total_content_width // 3
 
-        # Headers
-        bm25_header = f"BM25 (0%)"
-        partial_header = f"Partial ({partial_weight:.0f}%)"
-        rerank_header = "Rerank (100%)"
-
         # Adjust title length based on available space
         max_title_length = col_width - 15  # Space for "10. " and scores
 
-        # Print headers
-        header_line = f"{bm25_header:<{col_width}} | {partial_header:<{col_width}} | {rerank_header:<{col_width}}"
-        print(header_line)
-        print("-" * terminal_width)
-
-        # Print rows
-        for i in range(10):
-            # BM25 Only
-            if i < len(bm25_results):
-                movie = bm25_results[i]
-                title = self._truncate_title(movie['title'], max_title_length)
-                if show_scores:
-                    bm25_col = f"{i+1:2d}. {title} ({movie['normalized_bm25_score']:.3f})"
-                else:
-                    bm25_col = f"{i+1:2d}. {title}"
-            else:
-                bm25_col = ""
-
-            # Partial
-            if i < len(hybrid_results):
-                movie = hybrid_results[i]
-                title = self._truncate_title(movie['title'], max_title_length)
-                if show_scores:
-                    partial_col = f"{i+1:2d}. {title} ({movie['combined_score']:.3f})"
-                else:
-                    partial_col = f"{i+1:2d}. {title}"
-            else:
-                partial_col = ""
-
-            # Rerank Only
-            if i < len(rerank_results):
-                movie = rerank_results[i]
-                title = self._truncate_title(movie['title'], max_title_length)
-                if show_scores:
-                    rerank_col = f"{i+1:2d}. {title} ({movie['cosine_similarity']:.3f})"
-                else:
-                    rerank_col = f"{i+1:2d}. {title}"
-            else:
-                rerank_col = ""
-
-            # Print row with proper truncation
-            bm25_col = bm25_col[:col_width]
-            partial_col = partial_col[:col_width]
-            rerank_col = rerank_col[:col_width]
+        self._layout = (terminal_width, col_width, max_title_length)
+        return self._layout
 
-            print(f"{bm25_col:<{col_width}} | {partial_col:<{col_width}} | {rerank_col:<{col_width}}")
+    def _table_frame(self, partial_weight: float) -> Tuple[str, str, str]:
+        """Return (row_fmt, header_line, separator) for the current layout
 
-        print("-" * terminal_width)
+        Cells are padded and clipped to the column width. Frames are cached
+        per partial_weight until the terminal is resized.
+        """
+        frame = self._frames.get(partial_weight)
+        if frame is None:
+            terminal_width, col_width, _ = self._column_layout()
+            cell = f"{{:<{col_width}.{col_width}}}"
+            row_fmt = " | ".join([cell] * 3)
+            header_line = row_fmt.format("BM25 (0%)", f"Partial ({partial_weight:.0f}%)",
+                                         "Rerank (100%)")
+            frame = self._frames[partial_weight] = (row_fmt, header_line, "-" * terminal_width)
+        return frame
+
+    def display_results(self, bm25_results: List[MovieResult], hybrid_results: List[MovieResult],
+                       rerank_results: List[MovieResult], show_scores: bool = False, partial_weight: float = 50.0,
+                       display_limit: int = 10) -> None:
+        """Display results using full terminal width"""
 
-    def _truncate_title(self, title: str, max_length: int) -> str:
-        """Truncate title to max_length with ellipsis if needed"""
-        if len(title) <= max_length:
-            return title
-        return title[:max_length-3] + "..."
+        _, _, max_title_length = self._column_layout()
+        row_fmt, header_line, separator = self._table_frame(partial_weight)
+
+        # The table is rendered into one string and written with a single call.
+        # Entries carry a score only when show_scores is set.
+        entry_fmt = "{:2d}. {} ({:.3f})" if show_scores else "{:2d}. {}"
+        lines = [header_line, separator]
+
+        # One column per ranking, padded with blank entries to display_limit
+        columns = []
+        for results, score_key in ((bm25_results, 'normalized_bm25_score'),
+                                   (hybrid_results, 'combined_score'),
+                                   (rerank_results, 'cosine_similarity')):
+            column = []
+            for i, movie in enumerate(results[:display_limit], 1):
+                title = movie.title
+                if len(title) > max_title_length:
+                    title = title[:max_title_length - 3] + "..."
+                column.append(entry_fmt.format(i, title, getattr(movie, score_key)))
+            column.extend([""] * (display_limit - len(column)))
+            columns.append(column)
+
+        lines.extend(row_fmt.format(*row) for row in zip(*columns))
+        lines.append(separator)
+        write_stdout("\n".join(lines) + "\n")
 
     def close(self) -> None:
         """Close database connection"""
@@ -260,13 +614,31 @@ class PersonalizedSearchEngine:
             self.db.close()
 
 
-def main():
-    """Main CLI entry point"""
+USAGE = ("usage: search_cli.py [-h] --query QUERY --user-id USER_ID [--show-scores]\n"
+         "                     [--partial-weight PARTIAL_WEIGHT] [--recall-limit RECALL_LIMIT]\n"
+         "                     [--ann-limit ANN_LIMIT] [--limit LIMIT] [--profile]")
+
+HELP_TEXT = USAGE + """
+
+Personalized Movie Search CLI
+
+options:
+  -h, --help            show this help message and exit
+  --query QUERY, -q QUERY
+                        Search query for movies (e.g., 'lord', 'king', 'ring')
+  --user-id USER_ID, -u USER_ID
+                        User ID for personalized recommendations
+  --show-scores, -s     Show similarity and BM25 scores in results
+  --partial-weight PARTIAL_WEIGHT, -p PARTIAL_WEIGHT
+                        Weight for partial personalization (0-100, default: 50)
+  --recall-limit RECALL_LIMIT, -r RECALL_LIMIT
+                        Number of BM25 candidates to retrieve for re-ranking (default: 100)
+  --ann-limit ANN_LIMIT, -a ANN_LIMIT
+                        Number of nearest-neighbour movies added as candidates, 0 disables (default: 100)
+  --limit LIMIT, -l LIMIT
+                        Number of results to show per column (default: 10)
+  --profile             Print the EXPLAIN (ANALYZE, BUFFERS) plan of the search query
 
-    parser = argparse.ArgumentParser(
-        description="Personalized Movie Search CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
     python search_cli.py --query "lord" --user-id 10001
     python search_cli.py --query "king" --user-id 10002 --show-scores
@@ -278,43 +650,143 @@ Test Users:
   - 10002: Fantasy Hater (dislikes fantasy movies)
   - 20001: Extreme Fantasy Lover (very strong preference)
   - 20002: Extreme Fantasy Hater (very strong dislike)
-        """
-    )
-
-    parser.add_argument(
-        "--query", "-q",
-        required=True,
-        help="Search query for movies (e.g., 'lord', 'king', 'ring')"
-    )
-
-    parser.add_argument(
-        "--user-id", "-u",
-        type=int,
-        required=True,
-        help="User ID for personalized recommendations"
-    )
-
-    parser.add_argument(
-        "--show-scores", "-s",
-        action="store_true",
-        help="Show similarity and BM25 scores in results"
-    )
-
-    parser.add_argument(
-        "--partial-weight", "-p",
-        type=float,
-        default=50.0,
-        help="Weight for partial personalization (0-100, default: 50)"
-    )
-
-    parser.add_argument(
-        "--recall-limit", "-r",
-        type=int,
-        default=100,
-        help="Number of BM25 candidates to retrieve for re-ranking (default: 100)"
-    )
-
-    args = parser.parse_args()
+"""
+
+# Value options: flag -> (destination, type)
+VALUE_OPTIONS = {
+    "--query": ("query", str), "-q": ("query", str),
+    "--user-id": ("user_id", int), "-u": ("user_id", int),
+    "--partial-weight": ("partial_weight", float), "-p": ("partial_weight", float),
+    "--recall-limit": ("recall_limit", int), "-r": ("recall_limit", int),
+    "--ann-limit": ("ann_limit", int), "-a": ("ann_limit", int),
+    "--limit": ("display_limit", int), "-l": ("display_limit", int),
+}
+
+# Boolean flags: flag -> destination
+FLAG_OPTIONS = {
+    "--show-scores": "show_scores", "-s": "show_scores",
+    "--profile": "profile",
+}
+
+
+def watch_terminal_resize(engine: PersonalizedSearchEngine) -> None:
+    """Drop the engine's cached layout whenever the terminal is resized
+
+    Installs a SIGWINCH handler (POSIX only, main thread only) that chains
+    to the previously installed handler. The engine is held by a weak
+    reference, so the handler does not keep it alive.
+    """
+    if not hasattr(signal, "SIGWINCH"):
+        return
+
+    engine_ref = weakref.ref(engine)
+    previous = signal.getsignal(signal.SIGWINCH)
+
+    def on_resize(signum, frame):
+        engine = engine_ref()
+        if engine is not None:
+            engine._invalidate_layout()
+        if callable(previous):
+            previous(signum, frame)
+
+    try:
+        signal.signal(signal.SIGWINCH, on_resize)
+    except ValueError:
+        pass  # Not the main thread: the layout is computed once
+
+
+def usage_error(message: str) -> None:
+    """Print usage with an error message and exit with status 2"""
+    sys.stderr.write(f"{USAGE}\nsearch_cli.py: error: {message}\n")
+    sys.exit(2)
+
+
+# Negative numbers are values, not flags (as in argparse)
+_NEGATIVE_NUMBER_RE = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+def _expand_long_flag(flag: str) -> str:
+    """Resolve an unambiguous prefix of a long option (argparse allow_abbrev)"""
+    known = ["--help", *[f for f in FLAG_OPTIONS if f.startswith("--")],
+             *[f for f in VALUE_OPTIONS if f.startswith("--")]]
+    if flag in known:
+        return flag
+    matches = [option for option in known if option.startswith(flag)]
+    if len(matches) > 1:
+        usage_error(f"ambiguous option: {flag} could match {', '.join(matches)}")
+    return matches[0] if matches else flag
+
+
+def parse_argv(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """Parse command-line arguments without building an argparse parser
+
+    Accepts the same flags as the original argparse interface: --flag=value,
+    long-option prefixes, attached short values (-qlord, -u10001), -X=value
+    and bundled short flags (-sqlord). A value option refuses a following
+    argument that looks like a flag; negative numbers are accepted.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        Namespace with query, user_id, show_scores, partial_weight,
+        recall_limit, ann_limit, display_limit and profile attributes
+    """
+    args = SimpleNamespace(query=None, user_id=None, show_scores=False,
+                           partial_weight=50.0, recall_limit=100, ann_limit=100,
+                           display_limit=10, profile=False)
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    while argv:
+        flag = argv.pop(0)
+        value = None
+        if flag.startswith("--"):
+            if "=" in flag:
+                flag, value = flag.split("=", 1)
+            flag = _expand_long_flag(flag)
+        elif flag.startswith("-") and len(flag) > 2:
+            # -X=value, -Xvalue, or a bundle of short flags (-sqlord)
+            flag, rest = flag[:2], flag[2:]
+            if rest.startswith("="):
+                value = rest[1:]
+            elif flag in FLAG_OPTIONS or flag == "-h":
+                argv.insert(0, "-" + rest)
+            else:
+                value = rest
+
+        if flag in ("-h", "--help"):
+            sys.stdout.write(HELP_TEXT)
+            sys.exit(0)
+        elif flag in FLAG_OPTIONS:
+            if value is not None:
+                usage_error(f"argument {flag}: ignored explicit argument '{value}'")
+            setattr(args, FLAG_OPTIONS[flag], True)
+        elif flag in VALUE_OPTIONS:
+            dest, cast = VALUE_OPTIONS[flag]
+            if value is None:
+                if (not argv or argv[0].startswith("-") and argv[0] != "-"
+                        and not _NEGATIVE_NUMBER_RE.match(argv[0])):
+                    usage_error(f"argument {flag}: expected one argument")
+                value = argv.pop(0)
+            try:
+                setattr(args, dest, cast(value))
+            except ValueError:
+                usage_error(f"argument {flag}: invalid {cast.__name__} value: '{value}'")
+        else:
+            usage_error(f"unrecognized arguments: {flag}")
+
+    missing = [flag for flag, dest in (("--query", "query"), ("--user-id", "user_id"))
+               if getattr(args, dest) is None]
+    if missing:
+        usage_error(f"the following arguments are required: {', '.join(missing)}")
+
+    return args
+
+
+def main():
+    """Main CLI entry point"""
+
+    args = parse_argv()
 
     # Validate database configuration
     db_config = ConfigManager.get_db_config()
@@ -322,11 +794,13 @@ Test Users:
         sys.exit(1)
 
     # Create and run search engine
-    search_engine = PersonalizedSearchEngine()
+    search_engine = PersonalizedSearchEngine(profile=args.profile)
+    watch_terminal_resize(search_engine)
 
     try:
         search_engine.connect()
-        search_engine.search(args.query, args.user_id, args.show_scores, args.partial_weight, args.recall_limit)
+        search_engine.search(args.query, args.user_id, args.show_scores, args.partial_weight,
+                             args.recall_limit, args.ann_limit, args.display_limit)
 
     except KeyboardInterrupt:
         print_warning("\n⚠️  Search interrupted by user")
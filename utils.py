@@ -13,46 +13,95 @@ This module provides:
 """
 
 import os
+import atexit
 import sys
 import re
 import csv
 import json
+import uuid
+import struct
+import operator
 import logging
-import psycopg2
+import weakref
+import threading
 from dotenv import load_dotenv
-from psycopg2.extras import execute_values
-from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
-from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union, Tuple, Iterator, Iterable, Callable
+from contextlib import contextmanager, asynccontextmanager
+from itertools import count, islice
+from collections import namedtuple
 from pathlib import Path
 
+# psycopg2 is imported on first use so that CLI startup (--help, argument
+# errors, config validation) does not pay for loading the database driver.
+if TYPE_CHECKING:
+    import asyncpg
+    import psycopg2
+    import psycopg2.pool
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment lookups are process-lifetime constants; cached on first read
+# (None records an unset variable). ConfigManager.reload() clears the cache.
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _cached_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """os.getenv with the result cached for the life of the process"""
+    try:
+        value = _ENV_CACHE[key]
+    except KeyError:
+        value = _ENV_CACHE[key] = os.getenv(key)
+    return default if value is None else value
+
+
+# Database configurations that passed validate_config, as frozen item sets
+_VALID_CONFIGS = set()
+
 
 class ConfigManager:
     """Environment and configuration management for the re-ranking system"""
 
+    @staticmethod
+    def reload() -> None:
+        """Re-read .env and drop cached environment lookups (e.g. in tests)"""
+        load_dotenv()
+        _ENV_CACHE.clear()
+        _VALID_CONFIGS.clear()
+
     @staticmethod
     def get_db_config() -> Dict[str, str]:
         """Get database configuration from environment variables
 
         Uses standard PostgreSQL environment variables (PGHOST, PGPORT, etc.)
+        When the database is local (PGHOST=localhost) and DB_UNIX_SOCKET_DIR
+        is set, connections go through the UNIX-domain socket in that
+        directory instead of TCP loopback.
 
         Returns:
             Dict with database connection parameters
         """
+        host = _cached_env("PGHOST", "localhost")
+        socket_dir = _cached_env("DB_UNIX_SOCKET_DIR")
+        if host == "localhost" and socket_dir:
+            host = socket_dir  # libpq treats a path as a socket directory
+
         return {
-            "host": os.getenv("PGHOST", "localhost"),
-            "port": int(os.getenv("PGPORT", "5432")),
-            "database": os.getenv("PGDATABASE", "movie"),
-            "user": os.getenv("PGUSER", "postgres"),
-            "password": os.getenv("PGPASSWORD", ""),
+            "host": host,
+            "port": int(_cached_env("PGPORT", "5432")),
+            "database": _cached_env("PGDATABASE", "movie"),
+            "user": _cached_env("PGUSER", "postgres"),
+            "password": _cached_env("PGPASSWORD", ""),
+            "application_name": _cached_env("PGAPPNAME", "paradedb-reranker"),
         }
 
     @staticmethod
     def validate_config(config: Dict[str, str]) -> bool:
         """Validate database configuration
 
+        Valid configurations are remembered, so a DatabaseConnection created
+        per batch or request does not re-check the same settings.
+
         Args:
             config: Database configuration dictionary
 
@@ -62,12 +111,17 @@ class ConfigManager:
         Raises:
             ValueError: If configuration is invalid
         """
+        key = frozenset(config.items())
+        if key in _VALID_CONFIGS:
+            return True
+
         required_fields = ["host", "port", "database", "user"]
         for field in required_fields:
             if not config.get(field):
                 print_error(f"❌ Missing required configuration: {field}")
                 return False
 
+        _VALID_CONFIGS.add(key)
         return True
 
     @staticmethod
@@ -78,7 +132,7 @@ class ConfigManager:
             Dict with OpenRouter configuration
         """
         return {
-            "api_key": os.getenv("OPENROUTER_API_KEY"),
+            "api_key": _cached_env("OPENROUTER_API_KEY"),
             "base_url": "https://openrouter.ai/api/v1",
             "model": "sentence-transformers/all-minilm-l12-v2"
         }
@@ -94,7 +148,18 @@ class ConfigManager:
         Returns:
             Batch size integer
         """
-        return int(os.getenv(config_key, str(default)))
+        return int(_cached_env(config_key, str(default)))
+
+    @staticmethod
+    def get_pool_size() -> Tuple[int, int]:
+        """Get connection pool bounds from DB_POOL_MIN / DB_POOL_MAX
+
+        Returns:
+            Tuple of (minconn, maxconn); maxconn is at least minconn
+        """
+        minconn = max(0, int(_cached_env("DB_POOL_MIN", "1")))
+        maxconn = max(minconn, 1, int(_cached_env("DB_POOL_MAX", "4")))
+        return minconn, maxconn
 
     @staticmethod
     def validate_openrouter_config() -> bool:
@@ -103,7 +168,7 @@ class ConfigManager:
         Returns:
             bool: True if configuration is valid
         """
-        api_key = os.getenv("OPENROUTER_API_KEY")
+        api_key = _cached_env("OPENROUTER_API_KEY")
         if not api_key:
             print_error("❌ OpenRouter API key not configured!")
             print_info("💡 Set OPENROUTER_API_KEY environment variable")
@@ -112,49 +177,347 @@ class ConfigManager:
         return True
 
 
+# Connection pools keyed by connection parameters, created on first use
+_POOLS: Dict[Tuple, 'psycopg2.pool.ThreadedConnectionPool'] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(config: Dict[str, Any]) -> 'psycopg2.pool.ThreadedConnectionPool':
+    """Get (or lazily create) the connection pool for a database configuration
+
+    Args:
+        config: Database configuration dictionary
+
+    Returns:
+        ThreadedConnectionPool shared by all connections with this configuration
+    """
+    key = tuple(sorted(config.items()))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+
+            minconn, maxconn = ConfigManager.get_pool_size()
+            pool = ThreadedConnectionPool(minconn, maxconn, **config)
+            _POOLS[key] = pool
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Close every pooled connection at interpreter exit"""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.closeall()
+        _POOLS.clear()
+
+
+# execute_values page sizing: PostgreSQL accepts at most 65535 bind
+# parameters per statement, and pages are kept to ~4 MiB of SQL text
+MAX_BIND_PARAMETERS = 65535
+EXECUTE_VALUES_BYTE_BUDGET = 4 * 1024 * 1024
+
+# Single-row INSERT ... VALUES (...) [suffix], rewritten by execute_batch into
+# one multi-row VALUES statement per page (like JDBC's reWriteBatchedInserts)
+_SINGLE_ROW_INSERT_RE = re.compile(
+    r'^(\s*INSERT\s+INTO\s+\S+\s*\([^)]*\)\s*VALUES\s*)(\([^()]*\))(.*)$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# PostgreSQL binary COPY framing: signature, flags and header extension
+# length up front, a -1 field count as trailer, and -1 as the NULL length
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_TRAILER = struct.pack("!h", -1)
+_TEXT_OID = 25
+
+
+def _encode_text_array(values: List[str]) -> bytes:
+    """Encode a list of strings as a one-dimensional text[] (array_recv format)"""
+    if not values:
+        return struct.pack("!iii", 0, 0, _TEXT_OID)
+    parts = [struct.pack("!iiiii", 1, 0, _TEXT_OID, len(values), 1)]
+    for value in values:
+        data = value.encode("utf-8")
+        parts.append(struct.pack("!i", len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def _encode_vector(values: List[float]) -> bytes:
+    """Encode floats as a pgvector vector (dim, unused, float4 values)
+
+    NumPy arrays are converted to big-endian float4 in a single call.
+    """
+    if hasattr(values, "astype"):
+        return struct.pack("!hh", len(values), 0) + values.astype(">f4").tobytes()
+    return struct.pack(f"!hh{len(values)}f", len(values), 0, *values)
+
+
+# Binary COPY encoders by column type, each returning the field payload
+_COPY_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "int2": struct.Struct("!h").pack,
+    "int4": struct.Struct("!i").pack,
+    "int8": struct.Struct("!q").pack,
+    "float8": struct.Struct("!d").pack,
+    "text": lambda value: value.encode("utf-8"),
+    "text[]": _encode_text_array,
+    "vector": _encode_vector,
+}
+
+
+class BinaryCopyEncoder:
+    """Encodes rows into a reusable binary COPY buffer
+
+    The bytearray is allocated once and only grows, so encoding batch after
+    batch does not churn the allocator. flush() sends the buffered rows and
+    resets the encoder for the next batch.
+    """
+
+    _SHORT = struct.Struct("!h")
+    _INT = struct.Struct("!i")
+
+    def __init__(self, types: List[str], initial_size: int = 4 * 1024 * 1024):
+        """Initialize the encoder for a fixed column layout
+
+        Args:
+            types: Column types, one per column (keys of _COPY_ENCODERS)
+            initial_size: Initial buffer size in bytes
+        """
+        self._encoders = [_COPY_ENCODERS[column_type] for column_type in types]
+        self._buf = bytearray(max(initial_size, len(_COPY_HEADER) + 2))
+        self._pos = 0
+        self.rows = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard buffered rows; the buffer is kept for reuse"""
+        self._buf[:len(_COPY_HEADER)] = _COPY_HEADER
+        self._pos = len(_COPY_HEADER)
+        self.rows = 0
+
+    def _reserve(self, size: int) -> None:
+        """Grow the buffer (at least doubling) so size more bytes fit"""
+        shortfall = self._pos + size - len(self._buf)
+        if shortfall > 0:
+            self._buf.extend(bytes(max(shortfall, len(self._buf))))
+
+    def add_row(self, values: Iterable[Any]) -> None:
+        """Append one row; None values are encoded as NULL"""
+        fields = [None if value is None else encode(value)
+                  for encode, value in zip(self._encoders, values)]
+        self._reserve(2 + sum(4 if data is None else 4 + len(data) for data in fields))
+
+        buf = self._buf
+        self._SHORT.pack_into(buf, self._pos, len(fields))
+        pos = self._pos + 2
+        for data in fields:
+            if data is None:
+                self._INT.pack_into(buf, pos, -1)
+                pos += 4
+            else:
+                self._INT.pack_into(buf, pos, len(data))
+                pos += 4
+                buf[pos:pos + len(data)] = data
+                pos += len(data)
+        self._pos = pos
+        self.rows += 1
+
+    def flush(self, cursor: 'psycopg2.extensions.cursor', sql: str) -> int:
+        """Send the buffered rows with copy_expert and reset the encoder
+
+        Args:
+            cursor: Cursor to run the COPY on
+            sql: COPY ... FROM STDIN (FORMAT BINARY) statement
+
+        Returns:
+            Number of rows sent
+        """
+        self._reserve(len(_COPY_TRAILER))
+        self._buf[self._pos:self._pos + len(_COPY_TRAILER)] = _COPY_TRAILER
+        view = memoryview(self._buf)[:self._pos + len(_COPY_TRAILER)]
+        rows = self.rows
+        try:
+            cursor.copy_expert(sql, _BufferReader(view))
+        finally:
+            view.release()  # The bytearray cannot grow while a view exists
+            self.reset()
+        return rows
+
+
+class _BufferReader:
+    """Read-only file over a memoryview for copy_expert
+
+    Only the chunk copy_expert asks for is copied into bytes on each read,
+    never the whole payload.
+    """
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._pos
+        end = len(self._view) if size < 0 else min(start + size, len(self._view))
+        self._pos = end
+        return self._view[start:end].tobytes()
+
+
+# Prepared statement names per physical connection. Prepared statements
+# live as long as the server session, which outlives a DatabaseConnection
+# when connections are pooled.
+_PREPARED_STATEMENTS = weakref.WeakKeyDictionary()
+
+
+# psycopg2-style SQL tokens that matter to numbered_placeholders: quoted
+# text and comments (copied through), escaped percents and placeholders
+_SQL_TOKEN_RE = re.compile(r"""
+    '(?:[^']|'')*'                       # string literal
+  | "(?:[^"]|"")*"                       # quoted identifier
+  | \$((?:[A-Za-z_]\w*)?)\$.*?\$\1\$    # dollar-quoted string
+  | --[^\n]*                             # line comment
+  | /\*.*?\*/                            # block comment
+  | %%                                   # escaped percent
+  | %s                                   # placeholder
+""", re.VERBOSE | re.DOTALL)
+
+
+def numbered_placeholders(sql: str) -> str:
+    """Rewrite psycopg2-style SQL for PREPARE
+
+    Positional %s placeholders become $1, $2, ... and %% becomes %, as
+    psycopg2's own interpolation would. Placeholders inside string literals,
+    quoted identifiers and comments are left alone.
+    """
+    numbers = count(1)
+
+    def replace(match: 're.Match') -> str:
+        token = match.group(0)
+        if token == "%s":
+            return f"${next(numbers)}"
+        return token.replace("%%", "%")
+
+    return _SQL_TOKEN_RE.sub(replace, sql)
+
+
+def execute_statement(name: str, param_count: int) -> str:
+    """EXECUTE statement for a prepared statement taking param_count %s parameters"""
+    if not param_count:
+        return f"EXECUTE {name}"
+    return f"EXECUTE {name} ({', '.join(['%s'] * param_count)})"
+
+
+def _with_prepare(prepare_sql: str, sql: str, params: Optional[tuple]) -> str:
+    """Prefix sql with a PREPARE, escaped for psycopg2 when params are interpolated"""
+    if params:
+        prepare_sql = prepare_sql.replace("%", "%%")
+    return prepare_sql + sql
+
+
+# Session settings for bulk loads: commits return without waiting for the
+# WAL flush (a crash may lose the last few commits, never corrupt data)
+BULK_SESSION_OPTIONS = "-c synchronous_commit=off"
+
+
 class DatabaseConnection:
-    """Reusable database connection and transaction management"""
+    """Reusable database connection and transaction management
+
+    Connections are borrowed from a process-wide pool per configuration, so
+    repeated connect()/close() cycles reuse the same server sessions. When
+    DB_POOL_MAX connections are already checked out, connect() opens an
+    unpooled connection instead, which close() then closes.
+    """
 
-    def __init__(self, config: Optional[Dict[str, str]] = None):
+    def __init__(self, config: Optional[Dict[str, str]] = None, bulk_mode: bool = False):
         """Initialize database connection with configuration
 
         Args:
             config: Database configuration dictionary. If None, loads from environment.
+            bulk_mode: Open sessions with BULK_SESSION_OPTIONS for re-runnable
+                bulk ingestion. Bulk sessions get their own pool, so the
+                settings never leak into regular connections.
         """
         self.config = config or ConfigManager.get_db_config()
-        self.conn: Optional[psycopg2.extensions.connection] = None
+        if bulk_mode:
+            options = f"{self.config.get('options', '')} {BULK_SESSION_OPTIONS}".strip()
+            self.config = dict(self.config, options=options)
+        self.conn: Optional['psycopg2.extensions.connection'] = None
+        self._pool: Optional['psycopg2.pool.ThreadedConnectionPool'] = None
+        self._copy_encoders: Dict[Tuple[str, ...], BinaryCopyEncoder] = {}
 
         # Validate configuration
         if not ConfigManager.validate_config(self.config):
             raise ValueError("Invalid database configuration")
 
     def connect(self) -> None:
-        """Establish database connection"""
+        """Establish database connection (borrowed from the pool)"""
+        from psycopg2.pool import PoolError
+
         try:
-            self.conn = psycopg2.connect(**self.config)
+            pool = _get_pool(self.config)
+            try:
+                self.conn = pool.getconn()
+                self._pool = pool
+            except PoolError:
+                # Pool exhausted: getconn() does not wait, so fall back to
+                # a dedicated connection
+                import psycopg2
+
+                self.conn = psycopg2.connect(**self.config)
+                self._pool = None
             self.conn.autocommit = False
         except Exception as e:
             print_error(f"❌ Database connection failed: {e}")
             raise
 
     def close(self) -> None:
-        """Close database connection"""
+        """Return database connection to the pool it came from
+
+        Any open transaction is rolled back by the pool. Unpooled
+        connections are closed.
+        """
         if self.conn:
-            self.conn.close()
+            if self._pool is not None:
+                self._pool.putconn(self.conn)
+            else:
+                self.conn.close()
+            self.conn = None
+            self._pool = None
 
     def execute_batch(self, query: str, data: List[Any], template: Optional[str] = None,
-                      page_size: int = 1000) -> None:
+                      page_size: Optional[int] = None,
+                      byte_budget: int = EXECUTE_VALUES_BYTE_BUDGET) -> None:
         """Execute batch query using psycopg2 execute_values
 
+        The query normally carries a single "VALUES %s" placeholder. A plain
+        single-row INSERT ("... VALUES (%s, %s) [ON CONFLICT ...]") is also
+        accepted: its row tuple becomes the template, so each page is still
+        sent as one multi-row INSERT.
+
+        Without an explicit page_size, pages are packed as full as possible:
+        up to PostgreSQL's 65535 bind-parameter limit per statement, and
+        capped so a page's estimated SQL size stays within byte_budget.
+
         Args:
-            query: SQL query with %s placeholder
+            query: SQL query with a VALUES %s placeholder, or a single-row INSERT
             data: List of data tuples
             template: Optional template for execute_values
-            page_size: Page size for batch operations
+            page_size: Rows per statement (None sizes pages automatically)
+            byte_budget: Approximate SQL size per statement when auto-sizing
         """
         if not self.conn:
             raise RuntimeError("Database connection not established")
 
+        from psycopg2.extras import execute_values
+
+        if template is None:
+            match = _SINGLE_ROW_INSERT_RE.match(query)
+            if match:
+                query = f"{match.group(1)}%s{match.group(3)}"
+                template = match.group(2)
+
+        if page_size is None:
+            page_size = self._auto_page_size(data, template, byte_budget)
+
         try:
             with self.conn.cursor() as cursor:
                 execute_values(
@@ -168,6 +531,65 @@ class DatabaseConnection:
             print_error(f"❌ Batch execution failed: {e}")
             raise
 
+    @staticmethod
+    def _auto_page_size(data: List[Any], template: Optional[str], byte_budget: int) -> int:
+        """Rows per execute_values page for the parameter limit and byte budget
+
+        The row size is estimated from the text form of the first row.
+        """
+        if not data:
+            return 1
+        first = data[0]
+        if isinstance(first, (tuple, list)):
+            columns = len(first)
+        else:
+            columns = template.count("%s") if template else 1
+        row_bytes = len(str(first)) or 1
+
+        page_size = min(len(data), MAX_BIND_PARAMETERS // max(1, columns),
+                        byte_budget // row_bytes)
+        return max(1, page_size)
+
+    def copy_binary(self, table: str, columns: List[str], rows: Iterable[tuple],
+                    types: List[str]) -> int:
+        """Bulk load rows with COPY ... FROM STDIN (FORMAT BINARY)
+
+        Rows are encoded client-side in PostgreSQL's binary COPY format, so
+        the server neither parses SQL nor converts text per value. COPY has
+        no ON CONFLICT: use it for plain inserts (e.g. into temp tables).
+
+        Args:
+            table: Target table name
+            columns: Target column names, in row order
+            rows: Iterable of row tuples; None values are loaded as NULL
+            types: Column types, one per column: int2, int4, int8, float8,
+                text (also for varchar), text[] or vector
+
+        Returns:
+            Number of rows copied
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established")
+
+        # One encoder (and buffer) per column layout, reused across batches
+        encoder = self._copy_encoders.get(tuple(types))
+        if encoder is None:
+            encoder = self._copy_encoders[tuple(types)] = BinaryCopyEncoder(types)
+
+        try:
+            encoder.reset()
+            for row in rows:
+                encoder.add_row(row)
+
+            with self.conn.cursor() as cursor:
+                return encoder.flush(
+                    cursor,
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN (FORMAT BINARY)"
+                )
+        except Exception as e:
+            print_error(f"❌ Binary COPY failed: {e}")
+            raise
+
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[tuple]:
         """Execute a single query and return results
 
@@ -192,6 +614,38 @@ class DatabaseConnection:
             print_error(f"❌ Query execution failed: {e}")
             raise
 
+    def execute_query_stream(self, query: str, params: Optional[tuple] = None,
+                             itersize: int = 10000) -> Iterator[tuple]:
+        """Execute a query on a server-side (named) cursor and yield its rows
+
+        Rows are fetched itersize at a time, so large result sets never sit
+        in client memory at once and the caller can start on the first rows
+        early. The cursor lives in the current transaction; fully consume or
+        close the generator before committing.
+
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters
+            itersize: Rows fetched per network round-trip
+
+        Yields:
+            Result tuples
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established")
+
+        cursor = self.conn.cursor(name=f"stream_{uuid.uuid4().hex}")
+        cursor.itersize = itersize
+        try:
+            cursor.execute(query, params)
+            for row in cursor:
+                yield row
+        except Exception as e:
+            print_error(f"❌ Query execution failed: {e}")
+            raise
+        finally:
+            cursor.close()
+
     def execute_update(self, query: str, params: Optional[tuple] = None, commit: bool = True) -> int:
         """Execute an UPDATE/INSERT/DELETE query and return affected row count
 
@@ -244,6 +698,146 @@ class DatabaseConnection:
             print_error(f"❌ Query execution failed: {e}")
             raise
 
+    def _prepare_sql(self, name: str, query: str,
+                     param_types: Optional[Tuple[str, ...]] = None) -> str:
+        """PREPARE statement for name, or "" if this connection already has it"""
+        if name in _PREPARED_STATEMENTS.get(self.conn, ()):
+            return ""
+        types = f" ({', '.join(param_types)})" if param_types else ""
+        return f"PREPARE {name}{types} AS {numbered_placeholders(query)}; "
+
+    def _resync_prepared(self, name: str) -> None:
+        """Find out whether a PREPARE sent in a failed round-trip took effect
+
+        A PREPARE survives the rollback of its transaction, so the session is
+        asked whether the statement exists (after rolling back the aborted
+        transaction).
+        """
+        try:
+            self.conn.rollback()
+            with self.conn.cursor() as cursor:
+                cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_prepared_statements "
+                               "WHERE name = %s)", (name,))
+                if cursor.fetchone()[0]:
+                    _PREPARED_STATEMENTS.setdefault(self.conn, set()).add(name)
+        except Exception:
+            pass  # Connection unusable; its registry entry goes with it
+
+    def prepare(self, name: str, query: str,
+                param_types: Optional[Tuple[str, ...]] = None) -> None:
+        """PREPARE a statement once per physical connection
+
+        Repeat EXECUTEs only send the bind parameters, skipping parse and
+        plan. Repeated calls with the same name on the same connection are
+        no-ops.
+
+        Args:
+            name: Statement name
+            query: SQL query with positional %s placeholders
+            param_types: Optional PostgreSQL types for the parameters
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established")
+
+        prepare_sql = self._prepare_sql(name, query, param_types)
+        if prepare_sql:
+            self.execute_no_response(prepare_sql)
+            _PREPARED_STATEMENTS.setdefault(self.conn, set()).add(name)
+
+    def execute_query_prepared(self, name: str, query: str, params: tuple,
+                               param_types: Optional[Tuple[str, ...]] = None,
+                               setup_sql: str = "") -> List[tuple]:
+        """Run a query as a server-side prepared statement and return its rows
+
+        The PREPARE (first use on a connection only), setup_sql and the
+        EXECUTE go to the server in one round-trip, so a cold call costs no
+        more round-trips than a plain query.
+
+        Args:
+            name: Statement name
+            query: SQL query with positional %s placeholders
+            params: Query parameters
+            param_types: Optional PostgreSQL types for the parameters
+            setup_sql: Statements sent ahead of the query (e.g. SET LOCAL)
+
+        Returns:
+            List of result tuples. On failure the aborted transaction has
+            been rolled back if a PREPARE was part of the round-trip.
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established")
+
+        prepare_sql = self._prepare_sql(name, query, param_types)
+        execute_sql = execute_statement(name, len(params))
+        try:
+            rows = self.execute_query(setup_sql + _with_prepare(prepare_sql, execute_sql, params),
+                                      params)
+        except Exception:
+            if prepare_sql:
+                self._resync_prepared(name)
+            raise
+
+        if prepare_sql:
+            _PREPARED_STATEMENTS.setdefault(self.conn, set()).add(name)
+        return rows
+
+    def execute_prepared(self, name: str, query: str, params_list: Iterable[tuple],
+                         param_types: Optional[Tuple[str, ...]] = None,
+                         commit: bool = True, commit_every: Optional[int] = None) -> int:
+        """Run a prepared UPDATE/INSERT/DELETE once per parameter tuple
+
+        The PREPARE (first use on a connection only) rides along with the
+        first EXECUTE.
+
+        Args:
+            name: Statement name
+            query: SQL query with positional %s placeholders
+            params_list: Parameter tuples, one execution each
+            param_types: Optional PostgreSQL types for the parameters
+            commit: Whether to commit after the executions (default: True)
+            commit_every: With commit, also commit after every this many
+                executions, so a failure only rolls back the current chunk
+
+        Returns:
+            Total number of affected rows
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established")
+
+        prepare_sql = self._prepare_sql(name, query, param_types)
+        affected_rows = 0
+        pending = 0
+
+        try:
+            with self.conn.cursor() as cursor:
+                for params in params_list:
+                    execute_sql = execute_statement(name, len(params))
+                    if prepare_sql:
+                        cursor.execute(_with_prepare(prepare_sql, execute_sql, params),
+                                       params or None)
+                        _PREPARED_STATEMENTS.setdefault(self.conn, set()).add(name)
+                        prepare_sql = ""
+                    else:
+                        cursor.execute(execute_sql, params or None)
+                    affected_rows += cursor.rowcount
+
+                    pending += 1
+                    if commit and commit_every and pending == commit_every:
+                        self.conn.commit()
+                        pending = 0
+
+            if commit:
+                self.conn.commit()
+
+            return affected_rows
+        except Exception as e:
+            print_error(f"❌ Prepared statement execution failed: {e}")
+            if prepare_sql:
+                self._resync_prepared(name)
+            elif commit:
+                self.conn.rollback()
+            raise
+
     def commit(self) -> None:
         """Commit current transaction"""
         if not self.conn:
@@ -268,43 +862,226 @@ class DatabaseConnection:
         self.close()
 
 
+class AsyncDatabaseConnection:
+    """asyncpg connection pool for concurrent query workloads
+
+    For scripts that already run under an asyncio event loop. Requires the
+    optional asyncpg package (pip install asyncpg). Queries use asyncpg's
+    $1, $2, ... placeholders, not psycopg2's %s.
+    """
+
+    def __init__(self, config: Optional[Dict[str, str]] = None,
+                 init: Optional[Callable] = None):
+        """Initialize the async connection pool with configuration
+
+        Args:
+            config: Database configuration dictionary. If None, loads from environment.
+            init: Optional coroutine run on each new connection, e.g.
+                pgvector.asyncpg.register_vector to load vector columns
+        """
+        self.config = config or ConfigManager.get_db_config()
+        self.init = init
+        self.pool: Optional['asyncpg.pool.Pool'] = None
+
+        # Validate configuration
+        if not ConfigManager.validate_config(self.config):
+            raise ValueError("Invalid database configuration")
+
+    async def connect(self) -> None:
+        """Create the asyncpg pool (sized by DB_POOL_MIN / DB_POOL_MAX)"""
+        try:
+            import asyncpg
+        except ImportError as e:
+            raise ImportError("AsyncDatabaseConnection requires asyncpg: pip install asyncpg") from e
+
+        min_size, max_size = ConfigManager.get_pool_size()
+        server_settings = {}
+        if self.config.get("application_name"):
+            server_settings["application_name"] = self.config["application_name"]
+
+        try:
+            self.pool = await asyncpg.create_pool(
+                host=self.config["host"],
+                port=self.config["port"],
+                database=self.config["database"],
+                user=self.config["user"],
+                password=self.config.get("password") or None,
+                min_size=min_size,
+                max_size=max_size,
+                server_settings=server_settings,
+                init=self.init
+            )
+        except Exception as e:
+            print_error(f"❌ Database connection failed: {e}")
+            raise
+
+    async def close(self) -> None:
+        """Close the pool and all of its connections"""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+
+    async def fetch(self, query: str, *args: Any) -> List[Any]:
+        """Execute a query and return its rows (asyncpg Records)"""
+        if not self.pool:
+            raise RuntimeError("Database connection not established")
+
+        try:
+            async with self.pool.acquire() as conn:
+                return await conn.fetch(query, *args)
+        except Exception as e:
+            print_error(f"❌ Query execution failed: {e}")
+            raise
+
+    async def execute_many(self, query: str, args: Iterable[tuple]) -> None:
+        """Execute a statement once per argument tuple on one pooled connection"""
+        if not self.pool:
+            raise RuntimeError("Database connection not established")
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.executemany(query, args)
+        except Exception as e:
+            print_error(f"❌ Batch execution failed: {e}")
+            raise
+
+    async def copy_records_to_table(self, table: str, records: Iterable[tuple],
+                                    columns: List[str]) -> None:
+        """Bulk load records with asyncpg's binary COPY
+
+        Args:
+            table: Target table name
+            records: Iterable of row tuples
+            columns: Target column names, in row order
+        """
+        if not self.pool:
+            raise RuntimeError("Database connection not established")
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.copy_records_to_table(table, records=records, columns=columns)
+        except Exception as e:
+            print_error(f"❌ Binary COPY failed: {e}")
+            raise
+
+    async def __aenter__(self) -> 'AsyncDatabaseConnection':
+        """Async context manager entry"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit"""
+        await self.close()
+
+
+class _IconFormatter(logging.Formatter):
+    """Prefix messages with the record's icon; records without one print bare"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        icon = getattr(record, "icon", "")
+        return f"{icon} {message}" if icon else message
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler bound to whatever sys.stdout is at emit time
+
+    Like print(), it follows redirect_stdout() and test capture. Records
+    are flushed one by one only on a terminal; pipes and files keep
+    sys.stdout's buffering.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    def flush(self) -> None:
+        stream = sys.stdout
+        try:
+            interactive = stream.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+        if interactive:
+            stream.flush()
+
+
+# Status messages go through the "reranker" logger as "<emoji> message"
+# lines on stdout (the emoji rides along as the record's icon). Setting
+# RERANKER_QUIET=1 silences them entirely.
+_log = logging.getLogger("reranker")
+if not _log.handlers:
+    _log.propagate = False
+    _log.setLevel(logging.INFO)
+    if _cached_env("RERANKER_QUIET") == "1":
+        _handler = logging.NullHandler()
+    else:
+        _handler = _StdoutHandler()
+        _handler.setFormatter(_IconFormatter("%(message)s"))
+    _log.addHandler(_handler)
+
+
 class PrintUtils:
     """Consistent print utilities with emoji formatting"""
 
     @staticmethod
     def success(message: str) -> None:
         """Print success message with green emoji"""
-        print(f"✅ {message}")
+        _log.info("%s", message, extra={"icon": "✅"})
 
     @staticmethod
     def error(message: str) -> None:
         """Print error message with red emoji"""
-        print(f"❌ {message}")
+        _log.error("%s", message, extra={"icon": "❌"})
 
     @staticmethod
     def info(message: str) -> None:
         """Print info message with blue emoji"""
-        print(f"ℹ️  {message}")
+        _log.info("%s", message, extra={"icon": "ℹ️ "})
 
     @staticmethod
     def warning(message: str) -> None:
         """Print warning message with yellow emoji"""
-        print(f"⚠️  {message}")
+        _log.warning("%s", message, extra={"icon": "⚠️ "})
 
     @staticmethod
     def progress(message: str) -> None:
         """Print progress message with rocket emoji"""
-        print(f"🚀 {message}")
+        _log.info("%s", message, extra={"icon": "🚀"})
 
     @staticmethod
     def data(message: str) -> None:
         """Print data-related message with folder emoji"""
-        print(f"📁 {message}")
+        _log.info("%s", message, extra={"icon": "📁"})
 
     @staticmethod
     def database(message: str) -> None:
         """Print database-related message with database emoji"""
-        print(f"🗄️  {message}")
+        _log.info("%s", message, extra={"icon": "🗄️ "})
+
+
+def _fast_json_loads() -> Callable[[Union[str, bytes]], Any]:
+    """Return the fastest installed JSON parser: orjson, then ujson, then json
+
+    Imported on demand so that modules which never parse JSON in bulk do
+    not load the C extensions.
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        return json.loads
+
+
+# Trailing "(YYYY)" in MovieLens titles
+_YEAR_RE = re.compile(r'\((\d{4})\)$')
 
 
 class MovieDataUtils:
@@ -320,7 +1097,11 @@ class MovieDataUtils:
         Returns:
             Tuple of (clean_title, year) where year may be None
         """
-        year_match = re.search(r'\((\d{4})\)$', title)
+        # A year suffix always ends in ")", so other titles skip the regex
+        if not title.endswith(')'):
+            return title, None
+
+        year_match = _YEAR_RE.search(title)
         if year_match:
             year = int(year_match.group(1))
             clean_title = title[:year_match.start()].rstrip()
@@ -388,61 +1169,184 @@ class FileUtils:
         Returns:
             Number of data rows
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return sum(1 for _ in file) - 1  # Subtract header row
+        # Count newline bytes in 1 MiB binary blocks: no decoding and no
+        # per-line Python loop (mmap objects have no count() method, and
+        # slicing one into bytes would copy the whole file)
+        lines = 0
+        last_block = b''
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                lines += block.count(b'\n')
+                last_block = block
+
+        if last_block and not last_block.endswith(b'\n'):
+            lines += 1  # Final line without trailing newline
+        return max(lines - 1, 0)  # Subtract header row
 
     @staticmethod
-    def batch_csv_reader(file_path: Path, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    def batch_csv_reader(file_path: Path, batch_size: int,
+                         named_rows: bool = False) -> Iterator[List[Any]]:
         """Read CSV file in batches for memory efficiency
 
         Args:
             file_path: Path to CSV file
             batch_size: Number of rows per batch
+            named_rows: Yield namedtuples (fields named after the header,
+                non-identifier characters replaced by "_") instead of dicts.
+                The row type is built once per file; rows are about a third
+                the size of dicts and fields are read as row.movieId.
 
         Yields:
-            List of dictionaries representing CSV rows
+            List of dictionaries (or namedtuples) representing CSV rows.
+            Prefer batch_csv_rows when only known columns are needed.
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            batch = []
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            if named_rows:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    return
+                row_type = namedtuple("Row", [re.sub(r'\W', '_', name) for name in header],
+                                      rename=True)
+                width = len(header)
+
+                def make_row(values: List[str]) -> Any:
+                    # Short rows are padded with None and extra values
+                    # dropped, like DictReader
+                    if len(values) != width:
+                        values = (values + [None] * width)[:width]
+                    return row_type._make(values)
+
+                # Blank lines come back as [] and are skipped, like DictReader
+                rows = map(make_row, filter(None, reader))
+            else:
+                rows = csv.DictReader(file)
+
+            # islice pulls each batch from the reader in C; the last batch
+            # may be shorter
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                yield batch
 
+    @staticmethod
+    def batch_csv_rows(file_path: Path, batch_size: int,
+                       columns: List[str]) -> Iterator[List[Tuple[str, ...]]]:
+        """Read selected CSV columns in batches of tuples
+
+        Uses csv.reader with header-resolved column indices instead of
+        building a dict per row (see batch_csv_reader).
+
+        Args:
+            file_path: Path to CSV file
+            batch_size: Number of rows per batch
+            columns: Header names to extract, in tuple order
+
+        Yields:
+            Lists of tuples holding the requested column values (None for
+            a column missing from a short row)
+
+        Raises:
+            KeyError: If a requested column is missing from the header
+        """
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            missing = [column for column in columns if column not in header]
+            if missing:
+                raise KeyError(f"Columns not found in {file_path}: {', '.join(missing)}")
+
+            indices = [header.index(column) for column in columns]
+            if len(indices) == 1:
+                index = indices[0]
+                pick = lambda row: (row[index],)
+            else:
+                pick = operator.itemgetter(*indices)
+
+            # Rows too short for a requested column are padded with None,
+            # like DictReader; blank lines are skipped
+            width = max(indices) + 1
+            batch = [None] * batch_size
+            count = 0
             for row in reader:
-                batch.append(row)
-                if len(batch) >= batch_size:
+                if len(row) < width:
+                    if not row:
+                        continue
+                    row += [None] * (width - len(row))
+                batch[count] = pick(row)
+                count += 1
+                if count == batch_size:
                     yield batch
-                    batch = []
+                    batch = [None] * batch_size
+                    count = 0
 
-            if batch:  # Yield remaining rows
-                yield batch
+            if count:  # Yield remaining rows
+                yield batch[:count]
+
+    @staticmethod
+    def iter_json_embeddings(csv_path: Path, movie_id_col: str = 'movie_id',
+                             embedding_col: str = 'movie_embedding',
+                             raw_text: bool = False) -> Iterator[Tuple[int, Any]]:
+        """Stream embeddings from CSV with JSON-encoded vectors
+
+        Rows are parsed one at a time, so the file is never held in memory.
+
+        Args:
+            csv_path: Path to CSV file
+            movie_id_col: Name of movie ID column
+            embedding_col: Name of embedding column
+            raw_text: Yield the '[f1,f2,...]' text unparsed; it is already a
+                valid pgvector literal, so PostgreSQL can cast it directly
+
+        Yields:
+            Tuples of (movie_id, embedding). Embeddings are strings with
+            raw_text, else float32 NumPy arrays when NumPy is installed,
+            else float lists.
+        """
+        rows = FileUtils.batch_csv_rows(csv_path, 1000, [movie_id_col, embedding_col])
+        if raw_text:
+            for batch in rows:
+                for movie_id, embedding_json in batch:
+                    yield int(movie_id), embedding_json
+            return
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        json_loads = _fast_json_loads()
+
+        for batch in rows:
+            for movie_id, embedding_json in batch:
+                # Parse JSON string back to floats, kept as one contiguous
+                # float32 array (~1.5 KB) instead of a list of Python floats
+                embedding_vector = json_loads(embedding_json)
+                if np is not None:
+                    embedding_vector = np.asarray(embedding_vector, dtype=np.float32)
+
+                yield int(movie_id), embedding_vector
 
     @staticmethod
     def load_json_embeddings(csv_path: Path, movie_id_col: str = 'movie_id',
                            embedding_col: str = 'movie_embedding') -> List[Dict[str, Any]]:
         """Load embeddings from CSV with JSON-encoded vectors
 
+        Materializes iter_json_embeddings(); prefer streaming for bulk loads.
+
         Args:
             csv_path: Path to CSV file
             movie_id_col: Name of movie ID column
             embedding_col: Name of embedding column
 
         Returns:
-            List of dictionaries with movie_id and embedding_vector
+            List of dictionaries with movie_id and content_embedding
         """
-        embeddings = []
-
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                movie_id = int(row[movie_id_col])
-                # Parse JSON string back to list of floats
-                embedding_vector = json.loads(row[embedding_col])
-
-                embeddings.append({
-                    'movie_id': movie_id,
-                    'content_embedding': embedding_vector
-                })
-
-        return embeddings
+        return [
+            {'movie_id': movie_id, 'content_embedding': embedding_vector}
+            for movie_id, embedding_vector in FileUtils.iter_json_embeddings(
+                csv_path, movie_id_col, embedding_col)
+        ]
 
 
 class LoggingUtils:
@@ -505,3 +1409,26 @@ def db_transaction(config: Optional[Dict[str, str]] = None):
         raise
     finally:
         conn.close()
+
+
+@asynccontextmanager
+async def async_db_transaction(db: AsyncDatabaseConnection):
+    """Async counterpart of db_transaction (requires asyncpg)
+
+    The connection is borrowed from the pool of an already connected
+    AsyncDatabaseConnection, so transactions share its connections instead
+    of opening a pool each.
+
+    Args:
+        db: Connected AsyncDatabaseConnection
+
+    Yields:
+        asyncpg connection inside a transaction that commits on success and
+        rolls back on error
+    """
+    if not db.pool:
+        raise RuntimeError("Database connection not established")
+
+    async with db.pool.acquire() as conn:
+        async with conn.transaction():
+            yield conn